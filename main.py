@@ -1,14 +1,20 @@
 from __future__ import annotations
 
 import audioop
+import functools
+import itertools
 import json
 import math
+import queue
 import random
 import threading
 import wave
 import tkinter as tk
-from dataclasses import dataclass, field
+from collections import deque
+from dataclasses import dataclass, field, replace
 from pathlib import Path
+from types import MappingProxyType
+from typing import NamedTuple
 from tkinter import filedialog, messagebox, ttk
 
 try:
@@ -16,6 +22,16 @@ try:
 except Exception:  # pragma: no cover
     simpleaudio = None  # type: ignore
 
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
+
+try:
+    import numpy as np  # type: ignore
+except Exception:  # pragma: no cover
+    np = None  # type: ignore
+
 # Core configuration
 RESOURCE_KEYS = [
     "mallets",
@@ -29,33 +45,47 @@ RESOURCE_KEYS = [
 CONSUMABLE_KEYS = ["CC", "hooks", "Gold", "ME"]
 BASE_GENRES = ["Romance", "Adventure", "Comedy", "Tragedy", "Suspense"]
 FANTASY_GENRE = "Fantasy"
+ALL_GENRES = (*BASE_GENRES, FANTASY_GENRE)
+_SELECTABLE_GENRES = {True: ALL_GENRES, False: tuple(BASE_GENRES)}
 CHAPTER_LENGTHS = [10, 20, 30]
 TOTAL_CHAPTERS = 6
+HISTORY_LIMIT = 128
+
+
+class CheeseRule(NamedTuple):
+    resource: str
+    page_gain: int
+    chapter_enemy: str
+    post_enemy: str
+    post_fantasy_enemy: str
+    notoriety_gain: int
+
+
 CHEESE_HUNT_RULES = {
-    "T1": {
-        "resource": "T1 cheese",
-        "page_gain": 25,
-        "chapter_enemy": "T1 mouse",
-        "post_enemy": "Common Weaver - With T1 Cheese",
-        "post_fantasy_enemy": "Ultimate MythWeaver - With T1 Cheese",
-        "notoriety_gain": 25,
-    },
-    "T2": {
-        "resource": "T2 cheese",
-        "page_gain": 50,
-        "chapter_enemy": "T2 mouse",
-        "post_enemy": "Common Weaver - With T2 Cheese",
-        "post_fantasy_enemy": "Ultimate MythWeaver - With T2 Cheese",
-        "notoriety_gain": 50,
-    },
-    "T3": {
-        "resource": "T3 cheese",
-        "page_gain": 125,
-        "chapter_enemy": "T3 mouse",
-        "post_enemy": "Common Weaver - With T3 Cheese",
-        "post_fantasy_enemy": "Ultimate MythWeaver - With T3 Cheese",
-        "notoriety_gain": 125,
-    },
+    "T1": CheeseRule(
+        resource="T1 cheese",
+        page_gain=25,
+        chapter_enemy="T1 mouse",
+        post_enemy="Common Weaver - With T1 Cheese",
+        post_fantasy_enemy="Ultimate MythWeaver - With T1 Cheese",
+        notoriety_gain=25,
+    ),
+    "T2": CheeseRule(
+        resource="T2 cheese",
+        page_gain=50,
+        chapter_enemy="T2 mouse",
+        post_enemy="Common Weaver - With T2 Cheese",
+        post_fantasy_enemy="Ultimate MythWeaver - With T2 Cheese",
+        notoriety_gain=50,
+    ),
+    "T3": CheeseRule(
+        resource="T3 cheese",
+        page_gain=125,
+        chapter_enemy="T3 mouse",
+        post_enemy="Common Weaver - With T3 Cheese",
+        post_fantasy_enemy="Ultimate MythWeaver - With T3 Cheese",
+        notoriety_gain=125,
+    ),
 }
 SOUND_FILES = {
     "copy_message": "copy_message.wav",
@@ -94,19 +124,38 @@ DEFAULT_ENEMY_DROPS = {
         "mallets": 2.3,
     },
 }
+PAGE_COLORS = {
+    "Romance": "#d9534f",
+    "Adventure": "#f0ad4e",
+    "Comedy": "#5cb85c",
+    "Tragedy": "#0275d8",
+    "Suspense": "#613d7c",
+    FANTASY_GENRE: "#ffffff",
+}
+# Pie label positions only need whole-degree precision, so the trig is tabulated once.
+_PIE_COS = tuple(math.cos(math.radians(degree)) for degree in range(360))
+_PIE_SIN = tuple(math.sin(math.radians(degree)) for degree in range(360))
+_FANTASY_TEXT = {
+    True: "Fantasy genre is available. All five base genres have notoriety > 80.",
+    False: "Fantasy genre is locked. Needs every base genre notoriety to exceed 80.",
+}
 ALL_MATERIAL_TYPES = sorted(set(RESOURCE_KEYS + CONSUMABLE_KEYS))
+RESOURCE_KEY_SET = frozenset(RESOURCE_KEYS)
+CONSUMABLE_KEY_SET = frozenset(CONSUMABLE_KEYS)
+_NON_MULTIPLIED = frozenset(("Gold", "Diamond"))
+_CHAPTER_HUNT_FIELDS = ("resources", "consumables", "genre_pages")
+_POSTSCRIPT_HUNT_FIELDS = ("resources", "consumables", "notoriety")
 
-def _default_enemy_drops() -> dict:
-    return {enemy: dict(drops) for enemy, drops in DEFAULT_ENEMY_DROPS.items()}
+# Read-only per-enemy tables; drop edits rebuild the affected table, so fresh states can share these.
+_DEFAULT_ENEMY_DROPS_FROZEN = {enemy: MappingProxyType(dict(drops)) for enemy, drops in DEFAULT_ENEMY_DROPS.items()}
 
 
-def _copy_enemy_drops(source: dict) -> dict:
-    return {enemy: dict(drops) for enemy, drops in source.items()}
+def _default_enemy_drops() -> dict:
+    return dict(_DEFAULT_ENEMY_DROPS_FROZEN)
 
 
 def _default_genre_pages() -> dict:
-    genres = list(BASE_GENRES) + [FANTASY_GENRE]
-    return {genre: 0 for genre in genres}
+    return dict.fromkeys(ALL_GENRES, 0)
 
 
 def _copy_genre_pages(source: dict) -> dict:
@@ -117,8 +166,28 @@ def _copy_genre_pages(source: dict) -> dict:
     return pages
 
 
-def _copy_chapter_choices(choices: list[dict]) -> list[dict]:
-    return [dict(choice) for choice in choices]
+@functools.lru_cache(maxsize=256)
+def _format_float_text(value: float) -> str:
+    integer = int(value)
+    if abs(value - integer) < 1e-9:
+        return str(integer)
+    text = f"{value:.4f}".rstrip("0").rstrip(".")
+    return text if text else "0"
+
+
+@functools.lru_cache(maxsize=64)
+def _genre_weights(pages: tuple) -> tuple[tuple[str, ...], tuple[float, ...]]:
+    eligible = [(genre, value) for genre, value in zip(ALL_GENRES, pages) if value > 0]
+    population = tuple(genre for genre, _ in eligible)
+    return population, tuple(itertools.accumulate(value for _, value in eligible))
+
+
+def _clamp_notoriety(value: int) -> int:
+    return 0 if value < 0 else (200 if value > 200 else value)
+
+
+def _freeze_chapter_choices(choices: list[dict]) -> list[MappingProxyType]:
+    return [MappingProxyType(dict(choice)) for choice in choices]
 
 
 def _open_sound_path(name: str) -> Path:
@@ -129,76 +198,101 @@ class AudioManager:
     def __init__(self) -> None:
         self._enabled = True
         self._volume = 0.7
-        self._samples: dict[str, tuple[bytes, int, int, int]] = {}
-        self._lock = threading.Lock()
-        self._initialized = False
+        self._samples: dict[str, tuple[bytes, int, int, int] | None] = {}
+        self._scaled: dict[tuple[str, int], bytes] = {}
+        self._scaled_volume = self._volume
+        self._ready = threading.Event()
         self._available = False
+        self._queue: queue.Queue[tuple[str, float]] = queue.Queue()
+        self._worker = threading.Thread(target=self._run, name="sfx-worker", daemon=True)
+        self._worker.start()
         print(f"[SFX] AudioManager init (simpleaudio available: {simpleaudio is not None})")
 
     def configure(self, enabled: bool, volume: float) -> None:
-        with self._lock:
-            self._enabled = bool(enabled)
-            self._volume = max(0.0, min(1.0, float(volume)))
+        self._enabled = bool(enabled)
+        self._volume = max(0.0, min(1.0, float(volume)))
         print(f"[SFX] configure -> enabled={self._enabled}, volume={self._volume:.2f}")
 
     def ensure_loaded(self) -> None:
-        if simpleaudio is None:
-            with self._lock:
-                self._initialized = True
-                self._available = False
-            print('[SFX] simpleaudio not available; sounds disabled.')
+        if self._ready.is_set():
             return
-        with self._lock:
-            if self._initialized:
-                return
-            try:
-                for cue in SOUND_FILES:
-                    path = _open_sound_path(cue)
-                    with wave.open(str(path), "rb") as wf:
-                        params = wf.getparams()
-                        frames = wf.readframes(params.nframes)
-                        self._samples[cue] = (
-                            frames,
-                            params.nchannels,
-                            params.sampwidth,
-                            params.framerate,
-                        )
-                self._available = True
-                print(f"[SFX] Loaded {len(self._samples)} sound samples.")
-            except Exception as exc:
-                print(f'[SFX] Failed to load sounds: {exc}')
-                self._samples.clear()
-                self._available = False
-            finally:
-                self._initialized = True
+        self._available = simpleaudio is not None
+        if not self._available:
+            print('[SFX] simpleaudio not available; sounds disabled.')
+        self._ready.set()
+
+    def _load_sample(self, cue: str) -> tuple[bytes, int, int, int] | None:
+        if cue in self._samples:
+            return self._samples[cue]
+        sample = None
+        try:
+            path = _open_sound_path(cue)
+            with wave.open(str(path), "rb") as wf:
+                params = wf.getparams()
+                frames = wf.readframes(params.nframes)
+                sample = (
+                    frames,
+                    params.nchannels,
+                    params.sampwidth,
+                    params.framerate,
+                )
+            print(f"[SFX] Loaded sound sample '{cue}'.")
+        except Exception as exc:
+            print(f"[SFX] Failed to load sound '{cue}': {exc}")
+        self._samples[cue] = sample
+        return sample
 
     def play(self, cue: str) -> None:
         if not self._enabled:
             print(f"[SFX] Skipping '{cue}' (disabled).")
             return
+        if self._volume < 0.01:
+            print(f"[SFX] Skipping '{cue}' (muted).")
+            return
         if simpleaudio is None:
             print(f"[SFX] Skipping '{cue}' (simpleaudio missing).")
             return
-        with self._lock:
-            if not self._initialized:
-                self.ensure_loaded()
+        self._queue.put((cue, self._volume))
+
+    def _run(self) -> None:
+        # Decoding, scaling and playback submission all happen here, off the Tk main thread.
+        while True:
+            cue, volume = self._queue.get()
+            self.ensure_loaded()
             if not self._available:
                 print(f"[SFX] Skipping '{cue}' (audio unavailable).")
-                return
-            sample = self._samples.get(cue)
-        if not sample:
-            print(f"[SFX] Sample '{cue}' not found.")
-            return
-        data, channels, sample_width, frame_rate = sample
-        try:
-            payload = data if self._volume >= 0.999 else audioop.mul(data, sample_width, self._volume)
-            simpleaudio.play_buffer(payload, channels, sample_width, frame_rate)
-        except Exception as exc:
-            print(f"[SFX] Playback error for '{cue}': {exc}")
+                continue
+            sample = self._load_sample(cue)
+            if not sample:
+                print(f"[SFX] Sample '{cue}' not found.")
+                continue
+            data, channels, sample_width, frame_rate = sample
+            try:
+                payload = self._scaled_payload(cue, data, sample_width, volume)
+                simpleaudio.play_buffer(payload, channels, sample_width, frame_rate)
+            except Exception as exc:
+                print(f"[SFX] Playback error for '{cue}': {exc}")
+
+    def _scaled_payload(self, cue: str, data: bytes, sample_width: int, volume: float) -> bytes:
+        if volume >= 0.999:
+            return data
+        if volume != self._scaled_volume:
+            self._scaled.clear()
+            self._scaled_volume = volume
+        # The cache holds one scaled buffer per cue for the current volume (bucketed to whole percents).
+        vkey = int(volume * 100)
+        payload = self._scaled.get((cue, vkey))
+        if payload is None:
+            if np is not None and sample_width == 2:
+                samples = np.frombuffer(data, dtype=np.int16)
+                payload = (samples * (vkey / 100)).astype(np.int16).tobytes()
+            else:
+                payload = audioop.mul(data, sample_width, vkey / 100)
+            self._scaled[(cue, vkey)] = payload
+        return payload
 
 
 audio_manager = AudioManager()
-audio_manager.ensure_loaded()
 
 
 RECIPES = [
@@ -230,7 +324,7 @@ RECIPES = [
 ]
 
 
-@dataclass
+@dataclass(slots=True)
 class GameState:
     resources: dict = field(default_factory=lambda: {key: 0 for key in RESOURCE_KEYS})
     consumables: dict = field(default_factory=lambda: {key: 0 for key in CONSUMABLE_KEYS})
@@ -244,43 +338,35 @@ class GameState:
     current_chapter_genre: str | None = None
     current_chapter_progress: int = 0
     postscript_length: int = 10
-    pending_chapter_choices: list[dict] = field(default_factory=list)
+    pending_chapter_choices: list[MappingProxyType] = field(default_factory=list)
     run_fantasy_available: bool = False
     postscript_extended: bool = False
     run_mallets_spent: int = 0
     total_mallets_spent: int = 0
     total_diamonds_gain: float = 0.0
     pending_choices_locked: bool = False
+    _fantasy_unlocked: bool | None = field(default=None, init=False, repr=False, compare=False)
 
-    def clone(self) -> "GameState":
-        return GameState(
-            resources=dict(self.resources),
-            consumables=dict(self.consumables),
-            notoriety=dict(self.notoriety),
-            enemy_drops=_copy_enemy_drops(self.enemy_drops),
-            genre_pages=_copy_genre_pages(self.genre_pages),
-            total_hunts=self.total_hunts,
-            current_run_hunts=self.current_run_hunts,
-            chapter_position=self.chapter_position,
-            current_chapter_length=self.current_chapter_length,
-            current_chapter_genre=self.current_chapter_genre,
-            current_chapter_progress=self.current_chapter_progress,
-            postscript_length=self.postscript_length,
-            pending_chapter_choices=_copy_chapter_choices(self.pending_chapter_choices),
-            run_fantasy_available=self.run_fantasy_available,
-            postscript_extended=self.postscript_extended,
-            run_mallets_spent=self.run_mallets_spent,
-            total_mallets_spent=self.total_mallets_spent,
-            pending_choices_locked=self.pending_choices_locked,
-            total_diamonds_gain=self.total_diamonds_gain,
-        )
+    def shallow_clone(self, *owned: str) -> "GameState":
+        # Shares every container with ``self`` except the named dicts, which the caller is about to mutate.
+        state = replace(self)
+        for name in owned:
+            setattr(state, name, dict(getattr(self, name)))
+        return state
+
+    def with_change(self, category: str, key: str, value) -> "GameState":
+        return replace(self, **{category: {**getattr(self, category), key: value}})
+
+    def with_drop_change(self, enemy: str, material: str, value: float) -> "GameState":
+        drops = {**self.enemy_drops.get(enemy, {}), material: value}
+        return replace(self, enemy_drops={**self.enemy_drops, enemy: drops})
 
     def to_dict(self) -> dict:
         return {
             "resources": self.resources,
             "consumables": self.consumables,
             "notoriety": self.notoriety,
-            "enemy_drops": self.enemy_drops,
+            "enemy_drops": {enemy: dict(drops) for enemy, drops in self.enemy_drops.items()},
             "genre_pages": self.genre_pages,
             "total_hunts": self.total_hunts,
             "current_run_hunts": self.current_run_hunts,
@@ -289,7 +375,7 @@ class GameState:
             "current_chapter_genre": self.current_chapter_genre,
             "current_chapter_progress": self.current_chapter_progress,
             "postscript_length": self.postscript_length,
-            "pending_chapter_choices": self.pending_chapter_choices,
+            "pending_chapter_choices": [dict(choice) for choice in self.pending_chapter_choices],
             "run_fantasy_available": self.run_fantasy_available,
             "postscript_extended": self.postscript_extended,
             "run_mallets_spent": self.run_mallets_spent,
@@ -305,13 +391,12 @@ class GameState:
         state.consumables.update({key: float(data.get("consumables", {}).get(key, 0)) for key in CONSUMABLE_KEYS})
         raw_notoriety = data.get("notoriety", {})
         for genre in BASE_GENRES:
-            value = int(raw_notoriety.get(genre, 0))
-            state.notoriety[genre] = max(0, min(200, value))
+            state.notoriety[genre] = _clamp_notoriety(int(raw_notoriety.get(genre, 0)))
         raw_drops = data.get("enemy_drops", {})
         for enemy, drops in raw_drops.items():
             state.enemy_drops[enemy] = {material: float(amount) for material, amount in drops.items()}
         for enemy in DEFAULT_ENEMY_DROPS:
-            state.enemy_drops.setdefault(enemy, dict(DEFAULT_ENEMY_DROPS[enemy]))
+            state.enemy_drops.setdefault(enemy, _DEFAULT_ENEMY_DROPS_FROZEN[enemy])
         state.genre_pages = _copy_genre_pages(data.get("genre_pages", {}))
         state.total_hunts = int(data.get("total_hunts", 0))
         state.current_run_hunts = int(data.get("current_run_hunts", 0))
@@ -321,7 +406,7 @@ class GameState:
         state.current_chapter_genre = data.get("current_chapter_genre")
         state.current_chapter_progress = int(data.get("current_chapter_progress", 0))
         state.postscript_length = int(data.get("postscript_length", 10))
-        state.pending_chapter_choices = _copy_chapter_choices(data.get("pending_chapter_choices", []))
+        state.pending_chapter_choices = _freeze_chapter_choices(data.get("pending_chapter_choices", []))
         state.run_fantasy_available = bool(data.get("run_fantasy_available", False))
         state.postscript_extended = bool(data.get("postscript_extended", False))
         state.run_mallets_spent = int(data.get("run_mallets_spent", 0))
@@ -330,15 +415,31 @@ class GameState:
         state.total_diamonds_gain = float(data.get("total_diamonds_gain", 0.0))
         return state
 
+    def reset_for_next_chapter(self) -> None:
+        self.current_chapter_length = None
+        self.current_chapter_genre = None
+        self.current_chapter_progress = 0
+        self.pending_choices_locked = False
+
+    @property
+    def target_length(self) -> int | None:
+        return self.postscript_length if self.chapter_position == 7 else self.current_chapter_length
+
     def fantasy_unlocked(self) -> bool:
+        if self._fantasy_unlocked is not None:
+            return self._fantasy_unlocked
         return all(value > 80 for value in self.notoriety.values())
 
+    def cache_fantasy_unlocked(self) -> None:
+        # Only called once a state is committed; committed states are never mutated again.
+        self._fantasy_unlocked = all(value > 80 for value in self.notoriety.values())
+
 
 class HistoryManager:
     def __init__(self, initial_state: GameState):
         self._current = initial_state
-        self._undo = []
-        self._redo = []
+        self._undo: deque[GameState] = deque(maxlen=HISTORY_LIMIT)
+        self._redo: deque[GameState] = deque(maxlen=HISTORY_LIMIT)
 
     @property
     def current(self) -> GameState:
@@ -387,30 +488,52 @@ class SimulatorApp:
         self.drop_rows: dict[str, dict[str, tk.Widget]] = {}
         self.enemy_frames: dict[str, ttk.Frame] = {}
         self.add_buttons: dict[str, ttk.Button] = {}
+        self._rendered_drop_table: dict | None = None
+        self._rendered_drops: dict[str, object] = {}
         self.start_random_button: ttk.Button | None = None
         self.start_manual_button: ttk.Button | None = None
         self.extend_postscript_button: ttk.Button | None = None
+        self._single_hunt_buttons: tuple[tuple[ttk.Button, str], ...] = ()
+        self._batch_hunt_buttons: tuple[tuple[ttk.Button, str], ...] = ()
         self.pending_choices_frame: ttk.LabelFrame | None = None
         self.pending_choices_container: ttk.Frame | None = None
+        self._pending_choice_buttons: list[ttk.Button] = []
+        self._pending_lock_label: ttk.Label | None = None
+        self._last_pending_signature: tuple | None = None
+        self.notoriety_canvases: dict[str, tuple[tk.Canvas, int, str]] = {}
+        self._notoriety_drawn: dict[str, int] = {}
+        self._refresh_pending = False
         self.log_text: tk.Text | None = None
+        self._log_buffer: list[tuple[str, str | None]] = []
+        self._log_flush_scheduled = False
+        self._log_lines: list[str] = []
         self.cc_enabled = tk.BooleanVar(value=True)
+        self._cc_on = True
+        self._loot_multiplier = self._cc_multiplier()
+        self.cc_enabled.trace_add("write", self._cc_toggled)
         self.total_hunts_var = tk.StringVar(value="0")
         self.run_hunts_var = tk.StringVar(value="0")
         self.chapter_pos_var = tk.StringVar(value="0")
         self.chapter_length_var = tk.StringVar(value="—")
         self.chapter_genre_var = tk.StringVar(value="—")
         self.chapter_progress_var = tk.StringVar(value="0 / 0")
-        self.genre_page_vars = {genre: tk.StringVar(value="0") for genre in BASE_GENRES + [FANTASY_GENRE]}
+        self.genre_page_vars = {genre: tk.StringVar(value="0") for genre in ALL_GENRES}
         self.page_label_widgets: dict[str, ttk.Label] = {}
         self.pages_pie_canvas: tk.Canvas | None = None
+        self._last_pie_key: tuple | None = None
+        self._pie_empty: int | None = None
+        self._pie_arcs: dict[str, int] = {}
+        self._pie_texts: dict[str, int] = {}
         self.run_mallets_var = tk.StringVar(value="0")
         self.total_mallets_var = tk.StringVar(value="0")
         self.hunts_per_diamond_var = tk.StringVar(value="N/A")
         self.sfx_enabled = tk.BooleanVar(value=True)
         self.sfx_volume = tk.DoubleVar(value=25.0)
+        self._sfx_enabled_cache = True
+        self._last_sound_cfg: tuple[bool, float] | None = None
 
         self._build_layout()
-        self._refresh_view()
+        self._do_refresh_view()
         self._update_sound_settings()
 
     def _build_layout(self):
@@ -558,36 +681,27 @@ class SimulatorApp:
             ttk.Label(row, text=label).pack(side="left")
             entry = ttk.Entry(row, textvariable=var, width=8)
             entry.pack(side="right")
-            entry.bind(
-                "<FocusOut>",
-                lambda _event, key=label, cat=category, clamp_value=clamp, float_ok=allow_float: self._entry_changed(
-                    cat, key, clamp_value, float_ok
-                ),
-            )
-            entry.bind(
-                "<Return>",
-                lambda _event, key=label, cat=category, clamp_value=clamp, float_ok=allow_float: self._entry_changed(
-                    cat, key, clamp_value, float_ok
-                ),
-            )
+            handler = functools.partial(self._entry_changed, category, label, clamp, allow_float)
+            entry.bind("<FocusOut>", handler)
+            entry.bind("<Return>", handler)
 
-    def _entry_changed(self, category: str, key: str, clamp: bool, allow_float: bool = False):
+    def _entry_changed(self, category: str, key: str, clamp: bool, allow_float: bool = False, _event=None):
         parser = self._parse_float if allow_float else self._parse_int
-        value = parser(self._get_var(category, key).get())
+        var = self._get_var(category, key)
+        value = parser(var.get())
+        current = getattr(self.state, category).get(key, 0)
         if value is None:
             number_type = "number" if allow_float else "integer"
             messagebox.showerror("Invalid number", f"Please enter a valid {number_type} for {key}.")
-            self._refresh_view()
+            var.set(self._format_float(current))
             return
         if clamp:
-            value = max(0, min(200, value))
-        current_dict = getattr(self.state, category)
-        if current_dict.get(key) == value:
-            self._refresh_view()
+            value = _clamp_notoriety(value)
+        if current == value:
+            # Nothing to commit; only normalise the entry text (e.g. "5.0" -> "5").
+            var.set(self._format_float(current))
             return
-        new_state = self.state.clone()
-        getattr(new_state, category)[key] = value
-        self._commit_state(new_state)
+        self._commit_state(self.state.with_change(category, key, value))
 
     def _build_notoriety_display(self, container: ttk.LabelFrame):
         colors = ["#d9534f", "#f0ad4e", "#5cb85c", "#0275d8", "#613d7c"]
@@ -598,17 +712,21 @@ class SimulatorApp:
             canvas = tk.Canvas(column, width=30, height=120, bg="#f0f0f0", highlightthickness=1, highlightbackground="#ccc")
             canvas.pack(pady=5)
             bar = canvas.create_rectangle(5, 5, 25, 115, fill="#ffffff")
-            setattr(self, f"notoriety_canvas_{genre}", (canvas, bar, colors[idx]))
-            entry = ttk.Entry(column, textvariable=self.notoriety_vars[genre], width=6, justify="center")
-            entry.pack()
-            entry.bind(
-                "<FocusOut>",
-                lambda _event, key=genre: self._entry_changed("notoriety", key, True),
-            )
-            entry.bind(
-                "<Return>",
-                lambda _event, key=genre: self._entry_changed("notoriety", key, True),
+            self.notoriety_canvases[genre] = (canvas, bar, colors[idx])
+            handler = functools.partial(self._entry_changed, "notoriety", genre, True, False)
+            entry = ttk.Spinbox(
+                column,
+                from_=0,
+                to=200,
+                increment=1,
+                textvariable=self.notoriety_vars[genre],
+                width=6,
+                justify="center",
+                command=handler,
             )
+            entry.pack()
+            entry.bind("<FocusOut>", handler)
+            entry.bind("<Return>", handler)
 
     def _build_pages_section(self, container: ttk.Frame):
         pages_frame = ttk.LabelFrame(container, text="Current Pages")
@@ -688,6 +806,16 @@ class SimulatorApp:
             controls_frame, text="10-Hunt (T3)", command=lambda: self._batch_hunt("T3"), sound="copy_message"
         )
         self.hunt10_t3_button.grid(row=4, column=1, sticky="ew", pady=2, padx=(5, 0))
+        self._single_hunt_buttons = (
+            (self.hunt_t1_button, CHEESE_HUNT_RULES["T1"].resource),
+            (self.hunt_t2_button, CHEESE_HUNT_RULES["T2"].resource),
+            (self.hunt_t3_button, CHEESE_HUNT_RULES["T3"].resource),
+        )
+        self._batch_hunt_buttons = (
+            (self.hunt10_t1_button, CHEESE_HUNT_RULES["T1"].resource),
+            (self.hunt10_t2_button, CHEESE_HUNT_RULES["T2"].resource),
+            (self.hunt10_t3_button, CHEESE_HUNT_RULES["T3"].resource),
+        )
         self.extend_postscript_button = ttk.Button(
             controls_frame, text="Postscript +3 (cost 30 Mallets)", command=self._extend_postscript
         )
@@ -719,7 +847,7 @@ class SimulatorApp:
         ttk.Button(log_frame, text="Export Log", command=self._export_log).grid(
             row=1, column=0, columnspan=2, sticky="e", pady=(5, 0)
         )
-    def _get_var(self, category: str, key: str) -> tk.StringVar:
+    def _get_var(self, category: str, key: str) -> tk.Variable:
         mapping = {
             "resources": self.resource_vars,
             "consumables": self.consumable_vars,
@@ -766,7 +894,7 @@ class SimulatorApp:
             messagebox.showerror("Invalid quantity", "Craft quantity must be a positive integer.")
             self.quantity_var.set("1")
             return
-        new_state = self.state.clone()
+        new_state = self.state.shallow_clone("resources", "consumables")
         for key, amount in recipe["costs"].items():
             self._apply_delta(new_state, key, -amount * quantity)
         for key, amount in recipe["outputs"].items():
@@ -775,10 +903,10 @@ class SimulatorApp:
         self._commit_state(new_state)
 
     def _apply_delta(self, state: GameState, key: str, delta: int):
-        if key in state.resources:
+        if key in RESOURCE_KEY_SET:
             state.resources[key] += delta
             return
-        if key in state.consumables:
+        if key in CONSUMABLE_KEY_SET:
             state.consumables[key] += delta
             return
         raise KeyError(f"Unknown resource '{key}' in recipe definition.")
@@ -787,70 +915,64 @@ class SimulatorApp:
         drops = state.enemy_drops.get(enemy) or DEFAULT_ENEMY_DROPS.get(enemy)
         if not drops:
             return []
+        resources = state.resources
+        consumables = state.consumables
+        scaled = multiplier != 1.0
         results = []
+        add_result = results.append
         for material, amount in drops.items():
             value = float(amount)
-            if material not in {"Gold", "Diamond"}:
+            if scaled and material not in _NON_MULTIPLIED:
                 value *= multiplier
             if material == "Diamond":
                 state.total_diamonds_gain += value
-            self._apply_loot_amount(state, material, value)
-            results.append((material, value))
+            target = consumables if material in CONSUMABLE_KEY_SET else resources
+            if material in target:
+                target[material] += value
+            else:
+                target[material] = value
+            add_result((material, value))
         return results
 
-    def _apply_loot_amount(self, state: GameState, material: str, amount: float):
-        if material in state.resources:
-            state.resources[material] = state.resources.get(material, 0) + amount
-        elif material in state.consumables:
-            state.consumables[material] = state.consumables.get(material, 0) + amount
-        else:
-            state.resources[material] = state.resources.get(material, 0) + amount
-
-    def _page_gain_for_hunt(self, cheese_rule: dict | None) -> float:
+    def _page_gain_for_hunt(self, cheese_rule: CheeseRule | None) -> int:
         if cheese_rule:
-            return float(cheese_rule.get("page_gain", 0))
-        return 1.0
+            return cheese_rule.page_gain
+        return 1
 
-    def _handle_postscript_hunt(self, state: GameState, cheese_rule: dict, multiplier: float = 1.0):
-        selected_genre = self._select_genre_by_pages(state)
+    def _handle_postscript_hunt(
+        self, state: GameState, cheese_rule: CheeseRule, multiplier: float = 1.0, selected_genre: str | None = None
+    ):
+        if selected_genre is None:
+            selected_genre = self._select_genre_by_pages(state)
         if selected_genre is None:
             return None
         if selected_genre == FANTASY_GENRE:
-            drops = self._apply_enemy_loot(state, cheese_rule["post_fantasy_enemy"], multiplier)
+            drops = self._apply_enemy_loot(state, cheese_rule.post_fantasy_enemy, multiplier)
             for genre in state.notoriety:
                 state.notoriety[genre] = max(0, state.notoriety[genre] - 20)
-            return selected_genre, cheese_rule["post_fantasy_enemy"], drops
+            return selected_genre, cheese_rule.post_fantasy_enemy, drops
         else:
-            drops = self._apply_enemy_loot(state, cheese_rule["post_enemy"], multiplier)
-            gain = cheese_rule.get("notoriety_gain", 0)
+            drops = self._apply_enemy_loot(state, cheese_rule.post_enemy, multiplier)
+            gain = cheese_rule.notoriety_gain
             self._adjust_notoriety(state, selected_genre, gain)
-            return selected_genre, cheese_rule["post_enemy"], drops
+            return selected_genre, cheese_rule.post_enemy, drops
 
     def _select_genre_by_pages(self, state: GameState) -> str | None:
-        weights = []
-        for genre in BASE_GENRES + [FANTASY_GENRE]:
-            pages = max(0, state.genre_pages.get(genre, 0))
-            if pages > 0:
-                weights.append((genre, pages))
-        if not weights:
-            return random.choice(BASE_GENRES + [FANTASY_GENRE])
-        total = sum(weight for _, weight in weights)
-        pick = random.uniform(0, total)
-        cumulative = 0.0
-        for genre, weight in weights:
-            cumulative += weight
-            if pick <= cumulative:
-                return genre
-        return weights[-1][0]
+        return self._draw_genres_by_pages(state, 1)[0]
+
+    def _draw_genres_by_pages(self, state: GameState, count: int) -> list[str]:
+        population, cum_weights = _genre_weights(tuple(state.genre_pages.get(genre, 0) for genre in ALL_GENRES))
+        if not population:
+            return [random.choice(ALL_GENRES) for _ in range(count)]
+        return random.choices(population, cum_weights=cum_weights, k=count)
 
     def _adjust_notoriety(self, state: GameState, selected_genre: str, increase: int):
-        current = state.notoriety.get(selected_genre, 0)
-        state.notoriety[selected_genre] = max(0, min(200, current + increase))
-        for genre in state.notoriety.keys():
-            if genre == selected_genre:
-                continue
-            if state.notoriety[genre] > 1:
-                state.notoriety[genre] -= 1
+        notoriety = state.notoriety
+        value = notoriety.get(selected_genre, 0) + increase
+        notoriety[selected_genre] = 0 if value < 0 else (200 if value > 200 else value)
+        for genre, current in notoriety.items():
+            if genre != selected_genre and current > 1:
+                notoriety[genre] = current - 1
 
     def _log_hunt(self, display_genre: str, enemy_name: str, cheese_type: str, drops: list[tuple[str, float]]):
         cheese_label = cheese_type if cheese_type else "Unknown"
@@ -861,13 +983,29 @@ class SimulatorApp:
         self._log(message)
 
     def _log(self, message: str, tag: str | None = None):
-        if not self.log_text:
+        self._log_buffer.append((message, tag))
+        if not self._log_flush_scheduled:
+            self._log_flush_scheduled = True
+            self.root.after_idle(self._flush_log)
+
+    def _flush_log(self):
+        self._log_flush_scheduled = False
+        entries = self._log_buffer
+        self._log_buffer = []
+        self._write_log(entries)
+
+    def _write_log(self, entries: list[tuple[str, str | None]]):
+        if not self.log_text or not entries:
             return
+        chunks = []
+        add_line = self._log_lines.append
+        for message, tag in entries:
+            line = message + "\n"
+            add_line(line)
+            chunks.append(line)
+            chunks.append(tag or ())
         self.log_text.configure(state="normal")
-        if tag:
-            self.log_text.insert("end", message + "\n", tag)
-        else:
-            self.log_text.insert("end", message + "\n")
+        self.log_text.insert("end", *chunks)
         self.log_text.see("end")
         self.log_text.configure(state="disabled")
 
@@ -888,23 +1026,46 @@ class SimulatorApp:
         self._refresh_view()
 
     def _commit_state(self, new_state: GameState):
+        new_state.cache_fantasy_unlocked()
         self.history.commit(new_state)
         self.state = new_state
         self._refresh_view()
 
     def _refresh_view(self):
-        for key, value in self.state.resources.items():
-            self.resource_vars[key].set(self._format_float(value))
-        for key, value in self.state.consumables.items():
-            self.consumable_vars[key].set(self._format_float(value))
-        for genre, value in self.state.notoriety.items():
-            self.notoriety_vars[genre].set(str(value))
-            self._update_notoriety_bar(genre, value)
-        self.fantasy_var.set(self._fantasy_text())
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        self.root.after_idle(self._flush_refresh)
+
+    def _flush_refresh(self):
+        self._refresh_pending = False
+        self._do_refresh_view()
+
+    def _do_refresh_view(self):
+        state = self.state
+        set_var = self._set_var
+        fmt = self._format_float
+        rvars = self.resource_vars
+        cvars = self.consumable_vars
+        nvars = self.notoriety_vars
+        update_bar = self._update_notoriety_bar
+        for key, value in state.resources.items():
+            set_var(rvars[key], fmt(value))
+        for key, value in state.consumables.items():
+            set_var(cvars[key], fmt(value))
+        for genre, value in state.notoriety.items():
+            set_var(nvars[genre], str(value))
+            update_bar(genre, value)
+        set_var(self.fantasy_var, self._fantasy_text())
         self._update_history_buttons()
         self._refresh_drops()
         self._refresh_hunt_section()
 
+    def _set_var(self, var: tk.Variable, text: str):
+        # Writing an identical value still fires Tk traces and redraws bound widgets.
+        if var.get() != text:
+            var.set(text)
+
     def _update_history_buttons(self):
         if hasattr(self, "undo_button"):
             self.undo_button.config(state="normal" if self.history.can_undo() else "disabled")
@@ -912,28 +1073,37 @@ class SimulatorApp:
             self.redo_button.config(state="normal" if self.history.can_redo() else "disabled")
 
     def _refresh_drops(self):
+        if self.state.enemy_drops is self._rendered_drop_table:
+            return
+        self._rendered_drop_table = self.state.enemy_drops
         for enemy, drops in self.state.enemy_drops.items():
+            if self._rendered_drops.get(enemy) is drops:
+                continue
+            self._rendered_drops[enemy] = drops
             self._create_enemy_section(enemy)
             existing_rows = self.drop_rows.setdefault(enemy, {})
             existing_vars = self.drop_vars.setdefault(enemy, {})
             # Remove rows not present anymore
-            for material in list(existing_rows.keys()):
-                if material not in drops:
-                    existing_rows[material].destroy()
-                    del existing_rows[material]
-                    del existing_vars[material]
+            to_remove = [material for material in existing_rows if material not in drops]
+            for material in to_remove:
+                existing_rows[material].destroy()
+                del existing_rows[material]
+                del existing_vars[material]
             # Ensure rows exist and update values
             for material, amount in drops.items():
                 if material not in existing_vars:
                     self._create_drop_row(enemy, material)
-                existing_vars[material].set(self._format_float(amount))
+                self._set_var(existing_vars[material], self._format_float(amount))
         self._update_add_buttons()
 
     def _update_notoriety_bar(self, genre: str, value: int):
-        clamp_value = max(0, min(200, value))
-        canvas_info = getattr(self, f"notoriety_canvas_{genre}", None)
+        clamp_value = 0 if value < 0 else (200 if value > 200 else value)
+        canvas_info = self.notoriety_canvases.get(genre)
         if not canvas_info:
             return
+        if self._notoriety_drawn.get(genre) == clamp_value:
+            return
+        self._notoriety_drawn[genre] = clamp_value
         canvas, bar, color = canvas_info
         height = 110
         fill_height = int((clamp_value / 200) * height)
@@ -947,71 +1117,71 @@ class SimulatorApp:
             button.config(state=state)
 
     def _update_pages_display(self):
-        total_pages = sum(self.state.genre_pages.get(g, 0) for g in BASE_GENRES + [FANTASY_GENRE])
-        colors = {
-            "Romance": "#d9534f",
-            "Adventure": "#f0ad4e",
-            "Comedy": "#5cb85c",
-            "Tragedy": "#0275d8",
-            "Suspense": "#613d7c",
-            FANTASY_GENRE: "#ffffff",
-        }
+        pie_key = tuple(self.state.genre_pages.get(g, 0) for g in ALL_GENRES)
+        if pie_key == self._last_pie_key:
+            return
+        self._last_pie_key = pie_key
+        total_pages = sum(pie_key)
         for genre in self.genre_page_vars.keys():
             value = self.state.genre_pages.get(genre, 0)
             percent = (value / total_pages * 100) if total_pages > 0 else 0
             label = self.page_label_widgets.get(genre)
             if label:
                 label.config(text=f"{genre} ({percent:.0f}%)")
-        if self.pages_pie_canvas:
-            self.pages_pie_canvas.delete("slice")
-            start = 0
-            if total_pages == 0:
-                self.pages_pie_canvas.create_oval(10, 10, 150, 150, fill="#e0e0e0", outline="#c0c0c0", tags="slice")
-            else:
-                center_x, center_y = 80, 80
-                radius_inner = 50
-                for genre in BASE_GENRES + [FANTASY_GENRE]:
-                    value = self.state.genre_pages.get(genre, 0)
-                    if value <= 0:
-                        continue
-                    extent = value / total_pages * 360
-                    self.pages_pie_canvas.create_arc(
+        canvas = self.pages_pie_canvas
+        if canvas:
+            if not self._pie_arcs:
+                self._pie_empty = canvas.create_oval(10, 10, 150, 150, fill="#e0e0e0", outline="#c0c0c0", tags="slice")
+                for genre in ALL_GENRES:
+                    self._pie_arcs[genre] = canvas.create_arc(
                         10,
                         10,
                         150,
                         150,
-                        start=start,
-                        extent=extent,
-                        fill=colors.get(genre, "#dddddd"),
+                        start=0,
+                        extent=0,
+                        fill=PAGE_COLORS.get(genre, "#dddddd"),
                         outline="#ffffff",
+                        state="hidden",
                         tags="slice",
                     )
-                    mid_angle = math.radians(start + extent / 2)
-                    label_x = center_x + radius_inner * math.cos(mid_angle)
-                    label_y = center_y - radius_inner * math.sin(mid_angle)
-                    percent_text = f"{genre[0].upper()} ({(value / total_pages * 100):.0f}%)"
-                    self.pages_pie_canvas.create_text(
-                        label_x,
-                        label_y,
-                        text=percent_text,
-                        fill="#000000",
-                        font=("Arial", 8, "bold"),
-                        tags="slice",
+                    self._pie_texts[genre] = canvas.create_text(
+                        0, 0, text="", fill="#000000", font=("Arial", 8, "bold"), state="hidden", tags="slice"
                     )
-                    start += extent
+            canvas.itemconfig(self._pie_empty, state="normal" if total_pages == 0 else "hidden")
+            start = 0
+            center_x, center_y = 80, 80
+            radius_inner = 50
+            for genre, value in zip(ALL_GENRES, pie_key):
+                arc_id = self._pie_arcs[genre]
+                text_id = self._pie_texts[genre]
+                if total_pages == 0 or value <= 0:
+                    canvas.itemconfig(arc_id, state="hidden")
+                    canvas.itemconfig(text_id, state="hidden")
+                    continue
+                extent = value / total_pages * 360
+                canvas.itemconfig(arc_id, start=start, extent=extent, state="normal")
+                mid_angle = round(start + extent / 2) % 360
+                label_x = center_x + radius_inner * _PIE_COS[mid_angle]
+                label_y = center_y - radius_inner * _PIE_SIN[mid_angle]
+                canvas.coords(text_id, label_x, label_y)
+                canvas.itemconfig(
+                    text_id, text=f"{genre[0].upper()} ({(value / total_pages * 100):.0f}%)", state="normal"
+                )
+                start += extent
 
     def _refresh_hunt_section(self):
-        self.total_hunts_var.set(str(self.state.total_hunts))
-        self.run_hunts_var.set(str(self.state.current_run_hunts))
-        self.run_mallets_var.set(str(self.state.run_mallets_spent))
-        self.total_mallets_var.set(str(self.state.total_mallets_spent))
+        self._set_var(self.total_hunts_var, str(self.state.total_hunts))
+        self._set_var(self.run_hunts_var, str(self.state.current_run_hunts))
+        self._set_var(self.run_mallets_var, str(self.state.run_mallets_spent))
+        self._set_var(self.total_mallets_var, str(self.state.total_mallets_spent))
         diamonds = self.state.total_diamonds_gain
         if diamonds > 0:
             ratio = self.state.total_hunts / diamonds if diamonds else 0
-            self.hunts_per_diamond_var.set(f"{ratio:.2f}")
+            self._set_var(self.hunts_per_diamond_var, f"{ratio:.2f}")
         else:
-            self.hunts_per_diamond_var.set("N/A")
-        self.chapter_pos_var.set(str(self.state.chapter_position))
+            self._set_var(self.hunts_per_diamond_var, "N/A")
+        self._set_var(self.chapter_pos_var, str(self.state.chapter_position))
         if self.state.chapter_position == 7:
             length_display = str(self.state.postscript_length)
             genre_display = "—"
@@ -1028,12 +1198,12 @@ class SimulatorApp:
                 length_display = "Awaiting choice"
                 target_length = 0
             genre_display = self.state.current_chapter_genre or "Selecting"
-        self.chapter_length_var.set(length_display)
-        self.chapter_genre_var.set(genre_display)
+        self._set_var(self.chapter_length_var, length_display)
+        self._set_var(self.chapter_genre_var, genre_display)
         progress_value = self.state.current_chapter_progress
-        self.chapter_progress_var.set(f"{progress_value} / {target_length}")
+        self._set_var(self.chapter_progress_var, f"{progress_value} / {target_length}")
         for genre, var in self.genre_page_vars.items():
-            var.set(str(self.state.genre_pages.get(genre, 0)))
+            self._set_var(var, str(self.state.genre_pages.get(genre, 0)))
         self._update_pages_display()
 
         if self.start_random_button is not None:
@@ -1059,63 +1229,54 @@ class SimulatorApp:
             and not selection_blocked
             and (target_length or 0) > 0
         )
-        for cheese_type, button in [
-            ("T1", getattr(self, "hunt_t1_button", None)),
-            ("T2", getattr(self, "hunt_t2_button", None)),
-            ("T3", getattr(self, "hunt_t3_button", None)),
-        ]:
-            if button is None:
-                continue
-            rule = CHEESE_HUNT_RULES[cheese_type]
-            available = self.state.resources.get(rule["resource"], 0)
-            button_state = "normal" if (cheese_allowed and available > 0) else "disabled"
-            button.config(state=button_state)
-        batch_buttons = [
-            ("T1", getattr(self, "hunt10_t1_button", None)),
-            ("T2", getattr(self, "hunt10_t2_button", None)),
-            ("T3", getattr(self, "hunt10_t3_button", None)),
-        ]
-        for cheese_type, button in batch_buttons:
-            if button is None:
-                continue
-            rule = CHEESE_HUNT_RULES[cheese_type]
-            available = self.state.resources.get(rule["resource"], 0)
-            remaining = (target_length or 0) - self.state.current_chapter_progress
-            enabled = cheese_allowed and available >= 10 and remaining >= 10
+        resources = self.state.resources
+        for button, resource_key in self._single_hunt_buttons:
+            available = resources.get(resource_key, 0)
+            button.config(state="normal" if (cheese_allowed and available > 0) else "disabled")
+        remaining = (target_length or 0) - self.state.current_chapter_progress
+        for button, resource_key in self._batch_hunt_buttons:
+            enabled = cheese_allowed and resources.get(resource_key, 0) >= 10 and remaining >= 10
             button.config(state="normal" if enabled else "disabled")
 
         if self.pending_choices_frame is not None and self.pending_choices_container is not None:
-            for child in self.pending_choices_container.winfo_children():
-                child.destroy()
-            if self.state.pending_chapter_choices:
-                self.pending_choices_frame.grid()
-                locked = self.state.pending_choices_locked
-                for choice in self.state.pending_chapter_choices:
-                    choice_text = f"Length {choice['length']} - Genre {choice['genre']}"
-                    ttk.Button(
-                        self.pending_choices_container,
-                        text=choice_text,
-                        command=lambda c=choice: self._choose_next_chapter(c),
-                        state="disabled" if locked else "normal",
-                    ).pack(fill="x", pady=2)
-                if locked:
-                    ttk.Label(
-                        self.pending_choices_container,
-                        text="Complete the current chapter before selecting.",
-                        foreground="#666",
-                    ).pack(fill="x", pady=(4, 0))
-            else:
-                self.pending_choices_frame.grid_remove()
+            self._refresh_pending_choices()
+
+    def _refresh_pending_choices(self):
+        choices = self.state.pending_chapter_choices
+        locked = self.state.pending_choices_locked
+        signature = (tuple((choice["length"], choice["genre"]) for choice in choices), locked)
+        if signature == self._last_pending_signature:
+            return
+        self._last_pending_signature = signature
+        buttons = self._pending_choice_buttons
+        for widget in buttons:
+            widget.pack_forget()
+        if self._pending_lock_label is not None:
+            self._pending_lock_label.pack_forget()
+        if not choices:
+            self.pending_choices_frame.grid_remove()
+            return
+        self.pending_choices_frame.grid()
+        while len(buttons) < len(choices):
+            buttons.append(ttk.Button(self.pending_choices_container))
+        for button, choice in zip(buttons, choices):
+            button.config(
+                text=f"Length {choice['length']} - Genre {choice['genre']}",
+                command=functools.partial(self._choose_next_chapter, choice),
+                state="disabled" if locked else "normal",
+            )
+            button.pack(fill="x", pady=2)
+        if locked:
+            if self._pending_lock_label is None:
+                self._pending_lock_label = ttk.Label(
+                    self.pending_choices_container,
+                    text="Complete the current chapter before selecting.",
+                    foreground="#666",
+                )
+            self._pending_lock_label.pack(fill="x", pady=(4, 0))
 
     def _fantasy_text(self) -> str:
-        unlocked = self.state.fantasy_unlocked()
-        status = "available" if unlocked else "locked"
-        explanation = (
-            "All five base genres have notoriety > 80."
-            if unlocked
-            else "Needs every base genre notoriety to exceed 80."
-        )
-        return f"Fantasy genre is {status}. {explanation}"
+        return _FANTASY_TEXT[self.state.fantasy_unlocked()]
 
     def _save_snapshot(self):
         path = filedialog.asksaveasfilename(
@@ -1126,8 +1287,12 @@ class SimulatorApp:
         if not path:
             return
         try:
-            with open(path, "w", encoding="utf-8") as fh:
-                json.dump(self.state.to_dict(), fh, indent=2)
+            if orjson is not None:
+                payload = orjson.dumps(self.state.to_dict(), option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(self.state.to_dict(), indent=2).encode("utf-8")
+            with open(path, "wb") as fh:
+                fh.write(payload)
             messagebox.showinfo("Snapshot saved", f"Snapshot saved to {path}.")
         except OSError as exc:
             messagebox.showerror("Save failed", f"Failed to save snapshot:\n{exc}")
@@ -1140,8 +1305,9 @@ class SimulatorApp:
         if not path:
             return
         try:
-            with open(path, "r", encoding="utf-8") as fh:
-                raw = json.load(fh)
+            with open(path, "rb") as fh:
+                payload = fh.read()
+            raw = orjson.loads(payload) if orjson is not None else json.loads(payload)
         except (OSError, json.JSONDecodeError) as exc:
             messagebox.showerror("Load failed", f"Failed to load snapshot:\n{exc}")
             return
@@ -1157,28 +1323,25 @@ class SimulatorApp:
             return None
 
     def _format_float(self, value: float) -> str:
-        if abs(value - int(value)) < 1e-9:
-            return str(int(value))
-        text = f"{value:.4f}".rstrip("0").rstrip(".")
-        return text if text else "0"
+        if type(value) is int:
+            return str(value)
+        return _format_float_text(value)
 
     def _drop_value_changed(self, enemy: str, material: str):
         raw = self.drop_vars[enemy][material].get()
         value = self._parse_float(raw)
+        current_value = self.state.enemy_drops.get(enemy, {}).get(material, 0.0)
         if value is None:
             messagebox.showerror("Invalid number", f"Please enter a number for {enemy} - {material}.")
-            self._refresh_view()
+            self.drop_vars[enemy][material].set(self._format_float(current_value))
             return
-        current_value = self.state.enemy_drops.get(enemy, {}).get(material, 0.0)
         if current_value == value:
-            self._refresh_view()
+            self.drop_vars[enemy][material].set(self._format_float(current_value))
             return
-        new_state = self.state.clone()
-        new_state.enemy_drops.setdefault(enemy, {})[material] = value
-        self._commit_state(new_state)
+        self._commit_state(self.state.with_drop_change(enemy, material, value))
 
     def _available_drop_types(self, enemy: str) -> list[str]:
-        used = set(self.state.enemy_drops.get(enemy, {}).keys())
+        used = self.state.enemy_drops.get(enemy, {})
         return [item for item in ALL_MATERIAL_TYPES if item not in used]
 
     def _show_add_drop_dialog(self, enemy: str):
@@ -1205,12 +1368,9 @@ class SimulatorApp:
         dialog.bind("<Return>", lambda _event: confirm())
 
     def _add_drop_to_enemy(self, enemy: str, material: str):
-        new_state = self.state.clone()
-        drops = new_state.enemy_drops.setdefault(enemy, {})
-        if material in drops:
+        if material in self.state.enemy_drops.get(enemy, {}):
             return
-        drops[material] = 0.0
-        self._commit_state(new_state)
+        self._commit_state(self.state.with_drop_change(enemy, material, 0.0))
 
     def _start_random_run(self):
         if not self._ensure_can_start_run():
@@ -1222,7 +1382,7 @@ class SimulatorApp:
             return
         length = random.choice(CHAPTER_LENGTHS)
         genre = random.choice(available_genres)
-        new_state = self.state.clone()
+        new_state = self.state.shallow_clone()
         self._initialize_new_run_state(new_state, fantasy_available)
         self._begin_chapter(new_state, 1, length, genre)
         self._log(f"Run started with random selection: length {length}, genre {genre}")
@@ -1272,16 +1432,17 @@ class SimulatorApp:
         dialog.bind("<Return>", lambda _event: confirm())
 
     def _confirm_manual_start(self, length: int, genre: str):
-        new_state = self.state.clone()
-        if new_state.resources.get("mallets", 0) < 30:
+        mallets = self.state.resources.get("mallets", 0)
+        if mallets < 30:
             messagebox.showerror("Not enough Mallets", "You need at least 30 Mallets to pick manually.")
             return
-        new_state.resources["mallets"] -= 30
-        fantasy_available = new_state.fantasy_unlocked()
+        fantasy_available = self.state.fantasy_unlocked()
         if genre == FANTASY_GENRE and not fantasy_available:
             self._play_sound("dialog_open")
             messagebox.showerror("Fantasy locked", "Fantasy is not unlocked for this run.")
             return
+        new_state = self.state.shallow_clone("resources")
+        new_state.resources["mallets"] = mallets - 30
         self._initialize_new_run_state(new_state, fantasy_available)
         self._record_mallet_spend(new_state, 30)
         self._begin_chapter(new_state, 1, length, genre)
@@ -1324,110 +1485,142 @@ class SimulatorApp:
         else:
             self._log(f"Entered Chapter {chapter_number}: length {length}, genre {genre}")
 
-    def _genres_for_selection(self, fantasy_available: bool | None = None) -> list[str]:
+    def _genres_for_selection(self, fantasy_available: bool | None = None) -> tuple[str, ...]:
         if fantasy_available is None:
             fantasy_available = self.state.run_fantasy_available
-        genres = list(BASE_GENRES)
-        if fantasy_available:
-            genres.append(FANTASY_GENRE)
-        return genres
+        return _SELECTABLE_GENRES[bool(fantasy_available)]
 
     def _perform_hunt(self, cheese_type: str | None = None):
+        target_length = self._hunt_target_length(cheese_type)
+        if target_length is None:
+            return
+        cheese_rule = CHEESE_HUNT_RULES.get(cheese_type) if cheese_type else None
+        if cheese_rule:
+            available = self.state.resources.get(cheese_rule.resource, 0)
+            if available <= 0:
+                messagebox.showerror("Not enough cheese", f"You need at least 1 {cheese_rule.resource}.")
+                return
+        new_state = self.state.shallow_clone(*self._hunt_owned_fields())
+        self._apply_hunt(new_state, cheese_type, cheese_rule, target_length)
+        self._commit_state(new_state)
+
+    def _hunt_owned_fields(self) -> tuple[str, ...]:
+        # Chapter hunts add pages; Postscript hunts move notoriety instead.
+        return _POSTSCRIPT_HUNT_FIELDS if self.state.chapter_position == 7 else _CHAPTER_HUNT_FIELDS
+
+    def _hunt_target_length(self, cheese_type: str | None) -> int | None:
         if self.state.chapter_position == 0:
             messagebox.showinfo("Not started", "Enter the first chapter before hunting.")
-            return
+            return None
         if (
             self.state.pending_chapter_choices
             and not self.state.pending_choices_locked
             and self.state.chapter_position <= TOTAL_CHAPTERS
         ):
             messagebox.showinfo("Select chapter", "Choose the next chapter before continuing.")
-            return
+            return None
         if cheese_type is None:
             messagebox.showinfo("Select cheese", "Choose a cheese to hunt with.")
-            return
+            return None
         if not (1 <= self.state.chapter_position <= TOTAL_CHAPTERS or self.state.chapter_position == 7):
             messagebox.showinfo("Cannot use cheese", "You cannot hunt with cheese in this phase.")
-            return
-        target_length = (
-            self.state.postscript_length if self.state.chapter_position == 7 else self.state.current_chapter_length
-        )
+            return None
+        target_length = self.state.target_length
         if not target_length:
             messagebox.showerror("Invalid chapter", "There is no active chapter to progress.")
-            return
-        cheese_rule = CHEESE_HUNT_RULES.get(cheese_type) if cheese_type else None
-        if cheese_rule:
-            available = self.state.resources.get(cheese_rule["resource"], 0)
-            if available <= 0:
-                messagebox.showerror("Not enough cheese", f"You need at least 1 {cheese_rule['resource']}.")
-                return
-        new_state = self.state.clone()
+            return None
+        return target_length
+
+    def _apply_hunt(
+        self,
+        new_state: GameState,
+        cheese_type: str,
+        cheese_rule: CheeseRule | None,
+        target_length: int,
+        postscript_genre: str | None = None,
+    ):
+        self._spend_hunts(new_state, cheese_rule, 1, self._cc_on)
         if cheese_rule:
-            new_state.resources[cheese_rule["resource"]] = new_state.resources.get(cheese_rule["resource"], 0) - 1
-        new_state.current_chapter_progress += 1
-        new_state.total_hunts += 1
-        new_state.current_run_hunts += 1
+            resolve_hunt = self._hunt_resolver(new_state)
+            resolve_hunt(new_state, cheese_type, cheese_rule, self._loot_multiplier, postscript_genre)
+        self._check_chapter_end(new_state, target_length)
+
+    def _spend_hunts(self, state: GameState, cheese_rule: CheeseRule | None, count: int, cc_on: bool):
         if cheese_rule:
-            log_genre = None
-            log_enemy = None
-            log_drops = []
-            loot_multiplier = self._cc_multiplier() if self.cc_enabled.get() else 1.0
-            if self.cc_enabled.get():
-                new_state.consumables["CC"] = new_state.consumables.get("CC", 0) - 1
-            if new_state.chapter_position == 7:
-                result = self._handle_postscript_hunt(new_state, cheese_rule, loot_multiplier)
-                if result:
-                    log_genre, log_enemy, log_drops = result
-            elif new_state.current_chapter_genre:
-                gain = self._page_gain_for_hunt(cheese_rule)
-                current_pages = new_state.genre_pages.get(new_state.current_chapter_genre, 0)
-                new_state.genre_pages[new_state.current_chapter_genre] = current_pages + gain
-                log_genre = new_state.current_chapter_genre
-                log_enemy = cheese_rule["chapter_enemy"]
-                log_drops = self._apply_enemy_loot(new_state, log_enemy, loot_multiplier)
-            if log_genre and log_enemy is not None:
-                self._log_hunt(log_genre, log_enemy, cheese_type, log_drops)
+            resource_key = cheese_rule.resource
+            resources = state.resources
+            resources[resource_key] = resources.get(resource_key, 0) - count
+            if cc_on:
+                consumables = state.consumables
+                consumables["CC"] = consumables.get("CC", 0) - count
+        state.current_chapter_progress += count
+        state.total_hunts += count
+        state.current_run_hunts += count
+
+    def _hunt_resolver(self, state: GameState):
+        return self._resolve_postscript_hunt if state.chapter_position == 7 else self._resolve_chapter_hunt
+
+    def _resolve_chapter_hunt(
+        self,
+        new_state: GameState,
+        cheese_type: str,
+        cheese_rule: CheeseRule,
+        loot_multiplier: float,
+        _postscript_genre: str | None = None,
+    ):
+        genre = new_state.current_chapter_genre
+        if not genre:
+            return
+        pages = new_state.genre_pages
+        pages[genre] = pages.get(genre, 0) + self._page_gain_for_hunt(cheese_rule)
+        enemy = cheese_rule.chapter_enemy
+        self._log_hunt(genre, enemy, cheese_type, self._apply_enemy_loot(new_state, enemy, loot_multiplier))
+
+    def _resolve_postscript_hunt(
+        self,
+        new_state: GameState,
+        cheese_type: str,
+        cheese_rule: CheeseRule,
+        loot_multiplier: float,
+        postscript_genre: str | None = None,
+    ):
+        result = self._handle_postscript_hunt(new_state, cheese_rule, loot_multiplier, postscript_genre)
+        if result:
+            genre, enemy, drops = result
+            self._log_hunt(genre, enemy, cheese_type, drops)
+
+    def _check_chapter_end(self, new_state: GameState, target_length: int):
         if new_state.current_chapter_progress >= target_length:
             if new_state.chapter_position == 7:
                 self._finish_postscript(new_state)
             else:
                 self._handle_chapter_completion(new_state)
-        self._commit_state(new_state)
 
     def _handle_chapter_completion(self, state: GameState):
         if state.chapter_position >= TOTAL_CHAPTERS:
             self._enter_postscript(state)
             return
-        state.current_chapter_length = None
-        state.current_chapter_genre = None
-        state.current_chapter_progress = 0
-        state.pending_choices_locked = False
+        state.reset_for_next_chapter()
         if not state.pending_chapter_choices:
             state.pending_chapter_choices = self._generate_next_chapter_choices(state)
         self._log_chapter_choices("Available next chapters", state.pending_chapter_choices)
 
-    def _generate_next_chapter_choices(self, state: GameState) -> list[dict]:
+    def _generate_next_chapter_choices(self, state: GameState) -> list[MappingProxyType]:
         genres = self._genres_for_selection(state.run_fantasy_available)
-        choices = []
-        available_genres = genres.copy()
-        random.shuffle(available_genres)
-        for length in CHAPTER_LENGTHS:
-            if not available_genres:
-                available_genres = genres.copy()
-                random.shuffle(available_genres)
-            genre = available_genres.pop()
-            choices.append({"length": length, "genre": genre})
-        return choices
-
-    def _choose_next_chapter(self, choice: dict):
+        needed = len(CHAPTER_LENGTHS)
+        picks = random.sample(genres, min(len(genres), needed))
+        picks += random.choices(genres, k=needed - len(picks))
+        return [MappingProxyType({"length": length, "genre": genre}) for length, genre in zip(CHAPTER_LENGTHS, picks)]
+
+    def _choose_next_chapter(self, choice: MappingProxyType):
         if not choice or not choice.get("length"):
             return
-        new_state = self.state.clone()
-        if not new_state.pending_chapter_choices:
+        if not self.state.pending_chapter_choices:
             return
-        if new_state.pending_choices_locked:
+        if self.state.pending_choices_locked:
             messagebox.showinfo("Chapter in progress", "Finish the current chapter before selecting the next one.")
             return
+        new_state = self.state.shallow_clone()
         next_chapter_number = min(new_state.chapter_position + 1, TOTAL_CHAPTERS)
         # If chapter_position was 0 (should not happen), start at 1
         if next_chapter_number <= new_state.chapter_position:
@@ -1464,16 +1657,13 @@ class SimulatorApp:
         if self.state.chapter_position != 7:
             messagebox.showinfo("Not in Postscript", "You can only extend during Postscript.")
             return
-        if self.state.resources.get("mallets", 0) < 30:
-            self._play_sound("dialog_open")
-            messagebox.showerror("Not enough Mallets", "You need at least 30 Mallets to extend Postscript.")
-            return
-        new_state = self.state.clone()
-        if new_state.resources.get("mallets", 0) < 30:
+        mallets = self.state.resources.get("mallets", 0)
+        if mallets < 30:
             self._play_sound("dialog_open")
             messagebox.showerror("Not enough Mallets", "You need at least 30 Mallets to extend Postscript.")
             return
-        new_state.resources["mallets"] -= 30
+        new_state = self.state.shallow_clone("resources")
+        new_state.resources["mallets"] = mallets - 30
         new_state.postscript_length += 3
         new_state.postscript_extended = True
         self._record_mallet_spend(new_state, 30)
@@ -1484,42 +1674,55 @@ class SimulatorApp:
         if not self.state.pending_chapter_choices:
             messagebox.showinfo("Nothing to reroll", "There are no pending chapters to reroll.")
             return
-        if self.state.resources.get("mallets", 0) < 3:
-            self._play_sound("dialog_open")
-            messagebox.showerror("Not enough Mallets", "You need at least 3 Mallets to reroll.")
-            return
-        new_state = self.state.clone()
-        if new_state.resources.get("mallets", 0) < 3:
+        mallets = self.state.resources.get("mallets", 0)
+        if mallets < 3:
             self._play_sound("dialog_open")
             messagebox.showerror("Not enough Mallets", "You need at least 3 Mallets to reroll.")
             return
-        new_state.resources["mallets"] -= 3
+        new_state = self.state.shallow_clone("resources")
+        new_state.resources["mallets"] = mallets - 3
         new_state.pending_chapter_choices = self._generate_next_chapter_choices(new_state)
         self._record_mallet_spend(new_state, 3)
         self._log_chapter_choices("Rerolled chapter options", new_state.pending_chapter_choices)
         self._commit_state(new_state)
 
-    def _log_chapter_choices(self, prefix: str, choices: list[dict]):
-        formatted = ", ".join(f"{item['length']}-{item['genre']}" for item in choices)
+    def _log_chapter_choices(self, prefix: str, choices: list[MappingProxyType]):
+        formatted = ", ".join([f"{item['length']}-{item['genre']}" for item in choices])
         self._log(f"{prefix}: {formatted}")
 
     def _batch_hunt(self, cheese_type: str):
         cheese_rule = CHEESE_HUNT_RULES.get(cheese_type)
         if not cheese_rule:
             return
-        available = self.state.resources.get(cheese_rule["resource"], 0)
+        target_length = self._hunt_target_length(cheese_type)
+        if target_length is None:
+            return
+        available = self.state.resources.get(cheese_rule.resource, 0)
         if available < 10:
-            messagebox.showerror("Not enough cheese", f"You need at least 10 {cheese_rule['resource']}.")
+            messagebox.showerror("Not enough cheese", f"You need at least 10 {cheese_rule.resource}.")
             return
-        target_length = (
-            self.state.postscript_length if self.state.chapter_position == 7 else self.state.current_chapter_length
-        )
-        remaining = (target_length or 0) - self.state.current_chapter_progress
+        remaining = target_length - self.state.current_chapter_progress
         if remaining < 10:
             messagebox.showinfo("Not enough progress", "Less than 10 hunts remain in this chapter.")
             return
-        for _ in range(10):
-            self._perform_hunt(cheese_type)
+        self._perform_hunt_batch(cheese_type, 10, target_length)
+
+    def _perform_hunt_batch(self, cheese_type: str, count: int, target_length: int):
+        # Callers guarantee at least ``count`` hunts remain, so only the last one can complete the chapter.
+        cheese_rule = CHEESE_HUNT_RULES[cheese_type]
+        new_state = self.state.shallow_clone(*self._hunt_owned_fields())
+        # Postscript hunts never add pages, so every draw in the batch uses the same weights.
+        if new_state.chapter_position == 7:
+            genres = self._draw_genres_by_pages(new_state, count)
+        else:
+            genres = [None] * count
+        loot_multiplier = self._loot_multiplier
+        self._spend_hunts(new_state, cheese_rule, count, self._cc_on)
+        resolve_hunt = self._hunt_resolver(new_state)
+        for genre in genres:
+            resolve_hunt(new_state, cheese_type, cheese_rule, loot_multiplier, genre)
+        self._check_chapter_end(new_state, target_length)
+        self._commit_state(new_state)
 
     def _record_mallet_spend(self, state: GameState, amount: int):
         state.run_mallets_spent += amount
@@ -1527,30 +1730,38 @@ class SimulatorApp:
         self._play_sound("button_click")
 
     def _update_sound_settings(self):
-        volume = max(0.0, min(100.0, float(self.sfx_volume.get())))
-        self.sfx_volume.set(volume)
+        raw_volume = float(self.sfx_volume.get())
+        volume = max(0.0, min(100.0, raw_volume))
+        if volume != raw_volume:
+            self.sfx_volume.set(volume)
+        enabled = bool(self.sfx_enabled.get())
+        self._sfx_enabled_cache = enabled
+        cfg = (enabled, volume)
+        if cfg == self._last_sound_cfg:
+            return
+        self._last_sound_cfg = cfg
         if hasattr(self, "sfx_volume_label"):
             self.sfx_volume_label.config(text=f"{int(volume)}%")
-        enabled = bool(self.sfx_enabled.get())
         audio_manager.configure(enabled, volume / 100.0)
 
     def _play_sound(self, cue: str):
-        if not self.sfx_enabled.get():
+        if not self._sfx_enabled_cache:
             return
         audio_manager.play(cue)
 
     def _button(self, parent: tk.Widget, *, text: str, command, sound: str | None = None, **kwargs) -> ttk.Button:
-        def wrapped():
-            if sound:
-                self._play_sound(sound)
-            command()
+        if sound:
+            command = functools.partial(self._click_with_sound, sound, command)
+        return ttk.Button(parent, text=text, command=command, **kwargs)
 
-        return ttk.Button(parent, text=text, command=wrapped, **kwargs)
+    def _click_with_sound(self, sound: str, command):
+        self._play_sound(sound)
+        command()
 
     def _export_log(self):
         if not self.log_text:
             return
-        content = self.log_text.get("1.0", "end-1c")
+        self._flush_log()
         path = filedialog.asksaveasfilename(
             title="Export Log",
             defaultextension=".txt",
@@ -1560,11 +1771,15 @@ class SimulatorApp:
             return
         try:
             with open(path, "w", encoding="utf-8") as fh:
-                fh.write(content)
+                fh.writelines(self._log_lines)
             messagebox.showinfo("Export Log", f"Log exported to {path}")
         except OSError as exc:
             messagebox.showerror("Export Log", f"Failed to export log:\n{exc}")
 
+    def _cc_toggled(self, *_args):
+        self._cc_on = bool(self.cc_enabled.get())
+        self._loot_multiplier = self._cc_multiplier() if self._cc_on else 1.0
+
     def _cc_multiplier(self) -> float:
         return 2.0
 